@@ -45,6 +45,8 @@ def demo_multiple_repositories():
             
         except ValueError as e:
             print(f"   ❌ Error: {e}")
+        finally:
+            repo.close()
         
         print()
 
@@ -143,6 +145,7 @@ def demo_persistence_comparison():
         for lead in leads:
             print(f"   - {lead.name} ({lead.email}) [ID: {lead.id}]")
         print()
+        repo.close()
     
     print("📁 Check the generated files:")
     print("   - comparison.txt (line-by-line JSON)")
@@ -26,6 +26,8 @@ def main():
             
     except ValueError as e:
         print(f"Error: {e}")
+    finally:
+        repo.close()
 
 
 if __name__ == "__main__":
@@ -59,6 +59,8 @@ def demo_repository_switching():
             print(f"   - {lead.name} ({lead.email}) [ID: {lead.id}]")
     except ValueError as e:
         print(f"   Error: {e}")
+    finally:
+        file_repo.close()
     
     print()
 
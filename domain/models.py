@@ -1,24 +1,72 @@
 # domain/lead.py
 import logging
+import re
+import sys
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# One "@" with no whitespace on either side
+_match_email = re.compile(r"[^@\s]+@[^@\s]+").fullmatch
 
-@dataclass
+
+def _intern(value):
+    """Intern plain strings so re-reads of a file share one object each."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True, frozen=True)
 class Lead:
     name: str
     email: str
     id: int = None
 
+    @classmethod
+    def _unchecked(cls, name: str, email: str, id: int = None) -> "Lead":
+        """Build a lead from trusted, already-validated storage data.
+
+        Skips __post_init__, so only use it for data that was validated
+        when it was first saved. Stored names and emails are interned;
+        caller input never is, so it is not kept alive past its last use.
+        """
+        return cls._from_fields(_intern(name), _intern(email), id)
+
+    @classmethod
+    def _from_fields(cls, name: str, email: str, id: int) -> "Lead":
+        """Set the fields of a new lead directly, without validation."""
+        lead = cls.__new__(cls)
+        object.__setattr__(lead, "name", name)
+        object.__setattr__(lead, "email", email)
+        object.__setattr__(lead, "id", id)
+        return lead
+
+    def with_id(self, id: int) -> "Lead":
+        """Return a copy of this (already validated) lead with a new ID.
+
+        Leads are immutable, so repositories use this to assign IDs.
+        """
+        return Lead._from_fields(self.name, self.email, id)
+
     def is_valid_email(self) -> bool:
-        return "@" in self.email
+        return _match_email(self.email) is not None
 
     def is_valid_id(self) -> bool:
         return self.id is None or (isinstance(self.id, int) and self.id > 0)
     
     def __post_init__(self):
         """Validate the lead data after initialization"""
+        name = self.name
+        lead_id = self.id
+        # Fast path: one combined check for the common valid case
+        if not (
+            name and len(name) <= 100 and name.strip()
+            and _match_email(self.email)
+            and (lead_id is None or (isinstance(lead_id, int) and lead_id > 0))
+        ):
+            self._raise_validation_error()
+
+    def _raise_validation_error(self):
+        """Raise the ValueError describing the first failing check"""
         if not self.name or not self.name.strip():
             raise ValueError("Name cannot be empty")
 
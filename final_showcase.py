@@ -7,10 +7,14 @@ error handling, and advanced features to showcase the robustness
 of the SOLID principles implementation.
 """
 
+import contextlib
+import io
+import logging
 import time
 from typing import List
 
 from domain.models import Lead
+from infrastructure import email_notifier
 from infrastructure.db_lead_repo import InMemoryLeadRepository
 from infrastructure.email_notifier import EmailNotifier, SMSNotifier
 from infrastructure.json_lead_repo import JsonLeadRepository
@@ -19,6 +23,22 @@ from infrastructure.txt_lead_repo import TxtFileLeadRepository
 from services.lead_creator import LeadCreator
 
 
+@contextlib.contextmanager
+def silenced():
+    """Keep logging and console output out of timed sections."""
+    root = logging.getLogger()
+    previous_level = root.level
+    previous_quiet = email_notifier.QUIET
+    root.setLevel(logging.WARNING)
+    email_notifier.QUIET = True
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        email_notifier.QUIET = previous_quiet
+        root.setLevel(previous_level)
+
+
 def benchmark_repositories(num_leads: int = 1000):
     """Benchmark different repository implementations."""
     print(f"=== Performance Benchmark ({num_leads} leads) ===\n")
@@ -33,24 +53,24 @@ def benchmark_repositories(num_leads: int = 1000):
         print(f"📊 Testing {repo_name}:")
         creator = LeadCreator(repo=repo, notifiers=[])
         
-        # Measure write performance
-        start_time = time.time()
-        for i in range(num_leads):
-            try:
-                creator.create_lead(f"User {i}", f"user{i}@benchmark.com")
-            except ValueError:
-                pass  # Skip duplicates
-        write_time = time.time() - start_time
-        
-        # Measure read performance
-        start_time = time.time()
-        all_leads = repo.find_all()
-        read_all_time = time.time() - start_time
-        
-        # Measure search performance
-        start_time = time.time()
-        found = repo.find_by_email(f"user{num_leads//2}@benchmark.com")
-        search_time = time.time() - start_time
+        with silenced():
+            # Measure write performance
+            start_time = time.time()
+            # create_many skips duplicates and saves the batch in one call
+            creator.create_many(
+                (f"User {i}", f"user{i}@benchmark.com") for i in range(num_leads)
+            )
+            write_time = time.time() - start_time
+            
+            # Measure read performance
+            start_time = time.time()
+            all_leads = repo.find_all()
+            read_all_time = time.time() - start_time
+            
+            # Measure search performance
+            start_time = time.time()
+            found = repo.find_by_email(f"user{num_leads//2}@benchmark.com")
+            search_time = time.time() - start_time
         
         print(f"   ✍️  Write {len(all_leads)} leads: {write_time:.3f}s")
         print(f"   📖 Read all leads: {read_all_time:.4f}s")
@@ -58,6 +78,7 @@ def benchmark_repositories(num_leads: int = 1000):
         print(f"   📈 Avg write time: {(write_time/len(all_leads)*1000):.2f}ms per lead")
         
         # Cleanup
+        repo.close()
         if hasattr(repo, 'file_path'):
             import os
             if os.path.exists(repo.file_path):
@@ -146,6 +167,7 @@ def demonstrate_scalability():
     print(f"   🚀 Avg time per lead: {(total_time/successful_creates*1000):.2f}ms")
     
     # Cleanup
+    repo.close()
     import os
     if os.path.exists("scalability_test.json"):
         os.unlink("scalability_test.json")
@@ -248,6 +270,7 @@ def final_demonstration():
     print("\n🎉 System successfully demonstrates all SOLID principles!")
     
     # Cleanup
+    repo.close()
     import os
     if os.path.exists("final_demo.json"):
         os.unlink("final_demo.json")
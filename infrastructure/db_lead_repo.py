@@ -1,5 +1,6 @@
 # infrastructure/db_lead_repo.py
 import logging
+from typing import Dict, Optional, Tuple
 
 from domain.models import Lead
 from services.interfaces import LeadRepository
@@ -9,38 +10,60 @@ logger = logging.getLogger(__name__)
 
 class InMemoryLeadRepository(LeadRepository):
     def __init__(self):
-        self._leads = []
+        # Dicts preserve insertion order, so _by_id doubles as the lead list
+        self._by_id: Dict[int, Lead] = {}
+        self._by_email: Dict[str, Lead] = {}
         self._next_id = 1
+        # Immutable snapshot handed out by find_all, rebuilt after a save
+        self._leads_view: Optional[Tuple[Lead, ...]] = None
     
-    def save(self, lead):
-        """Save a lead and return it with an assigned ID"""
+    def _store(self, lead):
+        # Assign ID if not present; explicit IDs push the counter past them
         if lead.id is None:
-            lead.id = self._next_id
-            self._next_id += 1
+            lead = lead.with_id(self._next_id)
+        self._next_id = max(self._next_id, lead.id + 1)
         
-        # Check if lead already exists (update case)
-        existing_index = None
-        for i, existing_lead in enumerate(self._leads):
-            if existing_lead.id == lead.id:
-                existing_index = i
-                break
+        # Drop the old email mapping when an existing lead is updated
+        existing = self._by_id.get(lead.id)
+        if existing is not None and self._by_email.get(existing.email) is existing:
+            del self._by_email[existing.email]
         
-        if existing_index is not None:
-            self._leads[existing_index] = lead
-        else:
-            self._leads.append(lead)
+        self._by_id[lead.id] = lead
+        self._by_email.setdefault(lead.email, lead)
+        return lead
+    
+    def save(self, lead):
+        """Save a lead and return it with an assigned ID"""
+        lead = self._store(lead)
+        self._leads_view = None
         
-        log_msg = f"Saved lead: {lead.name} ({lead.email}) with ID {lead.id}"
-        logger.info(log_msg)
+        logger.info(
+            "Saved lead: %s (%s) with ID %s", lead.name, lead.email, lead.id
+        )
         return lead
     
+    def save_many(self, leads):
+        """Save several leads and return them with assigned IDs"""
+        saved = []
+        for lead in leads:
+            saved.append(self._store(lead))
+        self._leads_view = None
+        
+        logger.info("Saved %d leads", len(saved))
+        return saved
+    
+    def save_if_new(self, lead):
+        """Save a lead unless its email is already stored"""
+        if lead.email in self._by_email:
+            return None
+        return self.save(lead)
+    
     def find_by_email(self, email):
         """Find a lead by email address"""
-        for lead in self._leads:
-            if lead.email == email:
-                return lead
-        return None
+        return self._by_email.get(email)
     
     def find_all(self):
-        """Return all leads"""
-        return self._leads.copy()
+        """Return all leads as a tuple shared until the next save"""
+        if self._leads_view is None:
+            self._leads_view = tuple(self._by_id.values())
+        return self._leads_view
@@ -5,22 +5,29 @@ from services.interfaces import Notifier
 
 logger = logging.getLogger(__name__)
 
+# Set to True to silence the console echo of the mocks (e.g. in benchmarks)
+QUIET = False
+
 
 def send_mail(subject, message, from_email, recipient_list):
     """Mock send_mail function for demonstration purposes"""
-    logger.info("Sending email:")
-    logger.info(f"  Subject: {subject}")
-    logger.info(f"  From: {from_email}")
-    logger.info(f"  To: {recipient_list}")
-    logger.info(f"  Message: {message}")
-    print(f"📧 Email sent to {recipient_list}: {subject}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Sending email:")
+        logger.info("  Subject: %s", subject)
+        logger.info("  From: %s", from_email)
+        logger.info("  To: %s", recipient_list)
+        logger.info("  Message: %s", message)
+    if not QUIET:
+        print(f"📧 Email sent to {recipient_list}: {subject}")
     return True
 
 
 def send_sms(message, recipient):
     """Mock send_sms function for demonstration purposes"""
-    logger.info(f"Sending SMS to {recipient}: {message}")
-    print(f"📱 SMS sent to {recipient}: {message}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Sending SMS to %s: %s", recipient, message)
+    if not QUIET:
+        print(f"📱 SMS sent to {recipient}: {message}")
     return True
 
 
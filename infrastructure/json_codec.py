@@ -0,0 +1,39 @@
+# infrastructure/json_codec.py
+"""
+JSON encoding shared by the file-backed repositories.
+
+Uses orjson when it is installed (``pip install lead_manager[fast]``) and
+falls back to the stdlib json module otherwise. Both paths work on UTF-8
+bytes.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson can also parse memoryviews (e.g. over an mmap) without a copy
+HAS_ORJSON = orjson is not None
+
+
+def dumps(data, pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def loads(raw):
+    """Parse JSON bytes, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to handle the stdlib exception (plus UnicodeDecodeError for
+    invalid UTF-8 on the stdlib path).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -7,106 +7,349 @@ with better structure than the line-by-line text format.
 """
 import json
 import logging
+import mmap
 import os
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from domain.models import Lead
+from infrastructure.json_codec import HAS_ORJSON, dumps, loads
 from services.interfaces import LeadRepository
 
 logger = logging.getLogger(__name__)
 
+# Large enough that a full rewrite of a sizeable file is a handful of writes
+WRITE_BUFFER_SIZE = 256 * 1024
+
+# Files at least this big are parsed straight from a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# Soft cap on appended records held in memory when write-behind is enabled
+APPEND_BUFFER_LIMIT = 128 * 1024
+
 
 class JsonLeadRepository(LeadRepository):
-    """Repository that stores leads in a structured JSON file."""
+    """Repository that stores leads in a structured JSON file.
+
+    The file is parsed once on construction into in-memory indexes keyed by
+    id and email. New leads are spliced in front of the closing
+    ``],"next_id":N}`` of the document with a single write, so saving does
+    not re-serialize the leads already on disk. Updates to an existing id
+    (and files whose layout we did not write ourselves) fall back to a full
+    rewrite.
+
+    Every save is flushed to the OS so other readers see it, but fsync only
+    happens on commit() or close(). The file's (mtime, size) is checked
+    before each operation and the indexes are reloaded if another writer
+    changed it.
+
+    With ``write_behind=True`` appended records are collected in memory and
+    written once APPEND_BUFFER_LIMIT bytes are pending, or on flush(),
+    commit() or close(). This suits single-writer bulk loads: pending
+    records are invisible to other readers, and external changes are not
+    picked up while records are pending.
+    """
     
-    def __init__(self, file_path: str = "leads.json"):
+    def __init__(self, file_path: str = "leads.json", pretty: bool = False,
+                 write_behind: bool = False):
         self.file_path = file_path
+        self.pretty = pretty
+        self.write_behind = write_behind
+        # Rows in file order, plus indexes onto them; Lead objects are only
+        # built for the rows a caller actually asks for
+        self._rows: List[dict] = []
+        # Leads for _rows, built on the first find_all and kept in step
+        # with the rows from then on
+        self._leads: Optional[List[Lead]] = None
+        self._by_id: Dict[int, dict] = {}
+        self._by_email: Dict[str, dict] = {}
+        self._next_id = 1
+        self._has_rows = False
+        self._tail_offset = None
+        self._cache_key = None
+        # Reused buffer for records not yet spliced into the file
+        self._wbuf = bytearray()
         self._ensure_file_exists()
+        try:
+            self._load()
+        except Exception:
+            self._fh.close()
+            raise
     
     def _ensure_file_exists(self):
-        """Create an empty JSON file if it doesn't exist."""
-        if not os.path.exists(self.file_path):
-            with open(self.file_path, 'w') as f:
-                json.dump({"leads": [], "next_id": 1}, f, indent=2)
+        """Open the backing file, creating an empty JSON file if needed."""
+        fd = os.open(self.file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._fh = os.fdopen(fd, 'r+b', buffering=WRITE_BUFFER_SIZE)
+        if os.fstat(fd).st_size == 0:
+            self._write_data({"leads": [], "next_id": 1})
     
     def _read_data(self) -> dict:
-        """Read the entire JSON structure from file."""
+        """Read the entire JSON structure from file.
+
+        Large files are parsed by orjson directly from a read-only memory
+        map instead of being copied into a bytes object first.
+        """
         try:
-            with open(self.file_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.warning(f"Error reading {self.file_path}: {e}")
+            size = os.fstat(self._fh.fileno()).st_size
+            if not HAS_ORJSON or size < MMAP_THRESHOLD:
+                self._fh.seek(0)
+                return loads(self._fh.read())
+            with mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return loads(view)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning("Error reading %s: %s", self.file_path, e)
             return {"leads": [], "next_id": 1}
     
     def _write_data(self, data: dict):
         """Write the entire JSON structure to file."""
-        with open(self.file_path, 'w') as f:
-            json.dump(data, f, indent=2)
-    
-    def _leads_from_data(self, data: dict) -> List[Lead]:
-        """Convert JSON data to Lead objects."""
-        leads = []
-        for lead_data in data.get("leads", []):
-            try:
-                lead = Lead(
-                    name=lead_data['name'],
-                    email=lead_data['email'],
-                    id=lead_data.get('id')
-                )
-                leads.append(lead)
-            except KeyError as e:
-                logger.warning(f"Invalid lead data: {lead_data}. Error: {e}")
-        return leads
+        buf = dumps(data, self.pretty)
+        self._fh.seek(0)
+        self._fh.write(buf)
+        self._fh.truncate()
+        self._fh.flush()
+        self._remember_stat()
+        self._has_rows = bool(data["leads"])
+        self._tail_offset = self._locate_tail(buf, len(buf), data["next_id"])
     
-    def save(self, lead: Lead) -> Lead:
-        """Save a lead and return it with an assigned ID."""
+    def _tail(self, next_id: int) -> bytes:
+        """Bytes that close the leads array and the document."""
+        return b'],"next_id":%d}' % next_id
+    
+    def _locate_tail(self, end: bytes, size: int, next_id) -> Optional[int]:
+        """Offset where new leads can be spliced in, or None if unknown.
+
+        ``end`` holds the last bytes of the file and ``size`` its length.
+        """
+        if self.pretty or not isinstance(next_id, int):
+            return None
+        tail = self._tail(next_id)
+        if not end.endswith(tail):
+            return None
+        return size - len(tail)
+    
+    def _remember_stat(self):
+        """Record the file state the in-memory indexes correspond to."""
+        st = os.fstat(self._fh.fileno())
+        self._cache_key = (st.st_mtime_ns, st.st_size)
+    
+    def _refresh(self):
+        """Reload the indexes if another writer changed the file."""
+        if self._wbuf:
+            return
+        try:
+            st = os.stat(self.file_path)
+            if (st.st_mtime_ns, st.st_size) == self._cache_key:
+                return
+        except FileNotFoundError:
+            pass
+        
+        self._fh.close()
+        self._ensure_file_exists()
+        self._load()
+    
+    def _load(self):
+        """Populate the in-memory indexes from the file."""
+        self._rows = []
+        self._leads = None
+        self._by_id = {}
+        self._by_email = {}
         data = self._read_data()
+        for row in self._rows_from_data(data):
+            self._add_row(row)
         
-        # Assign ID if not present
-        if lead.id is None:
-            lead.id = data.get("next_id", 1)
-            data["next_id"] = lead.id + 1
+        # The counter lives in memory from here on and is only written out
+        # as part of the tail; never hand out an id that is already stored
+        next_id = data.get("next_id", 1)
+        if not isinstance(next_id, int):
+            next_id = 1
+        stored_ids = [key for key in self._by_id if isinstance(key, int)]
+        self._next_id = max(next_id, max(stored_ids, default=0) + 1)
+        self._has_rows = bool(data.get("leads"))
+        if list(data) == ["leads", "next_id"]:
+            size = os.fstat(self._fh.fileno()).st_size
+            self._fh.seek(max(size - 32, 0))
+            self._tail_offset = self._locate_tail(
+                self._fh.read(), size, self._next_id
+            )
+        else:
+            self._tail_offset = None
+        self._remember_stat()
+    
+    def _rows_from_data(self, data: dict) -> List[dict]:
+        """Extract the valid lead rows from JSON data.
+
+        ``leads`` is normally a list of rows, but an object keyed by id is
+        accepted too and is rewritten as a list on the next save.
+        """
+        rows = data.get("leads", [])
+        if isinstance(rows, dict):
+            keyed_rows = []
+            for key, row in rows.items():
+                try:
+                    keyed_rows.append({"id": int(key), **row})
+                except (ValueError, TypeError):
+                    logger.warning("Invalid lead %r: %s", key, row)
+            rows = keyed_rows
         
-        # Convert lead to dict
-        lead_dict = {
+        valid_rows = []
+        for lead_data in rows:
+            if 'name' in lead_data and 'email' in lead_data:
+                valid_rows.append(lead_data)
+            else:
+                logger.warning("Invalid lead data: %s", lead_data)
+        return valid_rows
+    
+    def _lead_from_row(self, row: dict) -> Lead:
+        return Lead._unchecked(row['name'], row['email'], row.get('id'))
+    
+    def _lead_dict(self, lead: Lead) -> dict:
+        return {
             "id": lead.id,
             "name": lead.name,
             "email": lead.email
         }
+    
+    def _add_row(self, row: dict, lead: Optional[Lead] = None):
+        """Append a row and index it.
+
+        Lookups return the first row with a given id or email, as a scan of
+        the file would; rows without an id are only indexed by email.
+        """
+        self._rows.append(row)
+        if self._leads is not None:
+            self._leads.append(lead or self._lead_from_row(row))
+        if row.get('id') is not None:
+            self._by_id.setdefault(row['id'], row)
+        self._by_email.setdefault(row['email'], row)
+    
+    def _replace_row(self, row: dict, lead: Lead):
+        """Put ``row`` in place of the stored row with the same id."""
+        previous = self._by_id[row['id']]
+        position = next(
+            i for i, stored in enumerate(self._rows) if stored is previous
+        )
+        self._rows[position] = row
+        if self._leads is not None:
+            self._leads[position] = lead
+        self._by_id[row['id']] = row
+    
+    def _reindex_emails(self):
+        """Rebuild the email index after updates changed stored rows."""
+        self._by_email = {}
+        for row in self._rows:
+            self._by_email.setdefault(row['email'], row)
+    
+    def _append(self, rows: List[dict]):
+        """Queue new lead rows to be spliced into the document."""
+        buf = self._wbuf
+        for row in rows:
+            if self._has_rows:
+                buf += b","
+            buf += dumps(row)
+            self._has_rows = True
         
-        # Check if lead already exists (update case)
-        leads = data.get("leads", [])
-        existing_index = None
-        for i, existing_lead in enumerate(leads):
-            if existing_lead.get("id") == lead.id:
-                existing_index = i
-                break
-        
-        if existing_index is not None:
-            leads[existing_index] = lead_dict
-        else:
-            leads.append(lead_dict)
-        
-        data["leads"] = leads
-        self._write_data(data)
+        if not self.write_behind or len(buf) >= APPEND_BUFFER_LIMIT:
+            self.flush()
+    
+    def flush(self):
+        """Splice pending records and the new tail into the file in one write."""
+        if not self._wbuf:
+            return
+        records_size = len(self._wbuf)
+        self._wbuf += self._tail(self._next_id)
+        self._fh.seek(self._tail_offset)
+        self._fh.write(self._wbuf)
+        self._fh.flush()
+        self._tail_offset += records_size
+        self._wbuf.clear()
+        self._remember_stat()
+    
+    def compact(self):
+        """Rewrite the file from the in-memory state."""
+        # Pending records are already in the indexes, so the rewrite covers them
+        self._wbuf.clear()
+        self._write_data({
+            "leads": self._rows,
+            "next_id": self._next_id
+        })
+    
+    def commit(self):
+        """Flush pending writes and fsync them to disk."""
+        self.flush()
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+    
+    def close(self):
+        """Commit and close the underlying file handle."""
+        if not self._fh.closed:
+            self.commit()
+            self._fh.close()
+    
+    def save(self, lead: Lead) -> Lead:
+        """Save a lead and return it with an assigned ID."""
+        self._refresh()
+        return self._save(lead)
+    
+    def save_if_new(self, lead: Lead) -> Optional[Lead]:
+        """Save a lead unless its email is already stored."""
+        self._refresh()
+        if lead.email in self._by_email:
+            return None
+        return self._save(lead)
+    
+    def save_many(self, leads: Iterable[Lead]) -> List[Lead]:
+        """Save several leads with a single file write."""
+        self._refresh()
+        saved = self._save_all(leads)
+        logger.info("Saved %d leads to JSON", len(saved))
+        return saved
+    
+    def _save_all(self, leads: Iterable[Lead]) -> List[Lead]:
+        saved = []
+        new_rows = []
+        needs_rewrite = self._tail_offset is None
+        has_updates = False
+        for lead in leads:
+            # Assign ID if not present; explicit IDs push the counter past them
+            if lead.id is None:
+                lead = lead.with_id(self._next_id)
+            self._next_id = max(self._next_id, lead.id + 1)
+            
+            # Updates rewrite the document; new leads are appended in place
+            row = self._lead_dict(lead)
+            if lead.id in self._by_id:
+                self._replace_row(row, lead)
+                has_updates = True
+            else:
+                self._add_row(row, lead)
+                new_rows.append(row)
+            saved.append(lead)
         
+        if has_updates:
+            self._reindex_emails()
+        if needs_rewrite or has_updates:
+            self.compact()
+        elif new_rows:
+            self._append(new_rows)
+        return saved
+    
+    def _save(self, lead: Lead) -> Lead:
+        lead = self._save_all([lead])[0]
         logger.info(
-            f"Saved lead to JSON: {lead.name} ({lead.email}) "
-            f"with ID {lead.id}"
+            "Saved lead to JSON: %s (%s) with ID %s",
+            lead.name, lead.email, lead.id
         )
         return lead
     
     def find_by_email(self, email: str) -> Optional[Lead]:
         """Find a lead by email address."""
-        data = self._read_data()
-        leads = self._leads_from_data(data)
-        
-        for lead in leads:
-            if lead.email == email:
-                return lead
-        return None
+        self._refresh()
+        row = self._by_email.get(email)
+        return self._lead_from_row(row) if row is not None else None
     
     def find_all(self) -> List[Lead]:
         """Return all leads."""
-        data = self._read_data()
-        return self._leads_from_data(data)
+        self._refresh()
+        if self._leads is None:
+            self._leads = [self._lead_from_row(row) for row in self._rows]
+        return list(self._leads)
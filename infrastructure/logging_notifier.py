@@ -6,7 +6,7 @@ modifying existing code. The logging notifier writes notifications
 to log files instead of sending emails or SMS.
 """
 import logging
-from datetime import datetime
+import sys
 
 from services.interfaces import Notifier
 
@@ -14,7 +14,7 @@ from services.interfaces import Notifier
 notification_logger = logging.getLogger('notifications')
 notification_logger.setLevel(logging.INFO)
 
-# Create file handler if not already present
+# Create file and console handlers if not already present
 if not notification_logger.handlers:
     handler = logging.FileHandler('notifications.log')
     formatter = logging.Formatter(
@@ -23,6 +23,27 @@ if not notification_logger.handlers:
     handler.setFormatter(formatter)
     notification_logger.addHandler(handler)
 
+    # Console echo for demo purposes; the record's asctime is formatted
+    # once per handler instead of building a separate timestamp per send
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter(
+        '📝 [%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    notification_logger.addHandler(console_handler)
+
+
+# ANSI color codes for ConsoleNotifier, shared by all instances
+_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "purple": "\033[95m",
+    "cyan": "\033[96m",
+    "white": "\033[97m",
+}
+_RESET = "\033[0m"
+
 
 class LoggingNotifier(Notifier):
     """Notifier that writes messages to a log file."""
@@ -32,34 +53,19 @@ class LoggingNotifier(Notifier):
     
     def send(self, message: str, recipient: str):
         """Log the notification message."""
-        log_message = f"NOTIFICATION to {recipient}: {message}"
-        notification_logger.log(self.log_level, log_message)
-        
-        # Also print to console for demo purposes
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"📝 [{timestamp}] Logged notification to {recipient}: {message}")
+        if notification_logger.isEnabledFor(self.log_level):
+            notification_logger.log(
+                self.log_level, "NOTIFICATION to %s: %s", recipient, message
+            )
 
 
 class ConsoleNotifier(Notifier):
     """Notifier that prints colorful messages to console."""
     
     def __init__(self, color: str = "blue"):
-        self.colors = {
-            "red": "\033[91m",
-            "green": "\033[92m", 
-            "yellow": "\033[93m",
-            "blue": "\033[94m",
-            "purple": "\033[95m",
-            "cyan": "\033[96m",
-            "white": "\033[97m",
-            "reset": "\033[0m"
-        }
-        self.color = self.colors.get(color, self.colors["blue"])
+        self.color = _COLORS.get(color, _COLORS["blue"])
+        self._prefix = f"{self.color}🔔 Console notification to "
     
     def send(self, message: str, recipient: str):
         """Print a colorful notification to console."""
-        reset = self.colors["reset"]
-        print(
-            f"{self.color}🔔 Console notification to {recipient}: "
-            f"{message}{reset}"
-        )
+        sys.stdout.write(f"{self._prefix}{recipient}: {message}{_RESET}\n")
@@ -2,106 +2,247 @@
 import json
 import logging
 import os
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from domain.models import Lead
+from infrastructure.json_codec import dumps, loads
 from services.interfaces import LeadRepository
 
 logger = logging.getLogger(__name__)
 
+# Explicit I/O buffer for all file access (the interpreter default is 8 KiB)
+BUFFER_SIZE = 128 * 1024
+
 
 class TxtFileLeadRepository(LeadRepository):
-    def __init__(self, file_path: str = "leads.txt"):
+    """Repository that stores one JSON object per line.
+
+    With ``write_behind=True`` appended lines stay in the 128 KiB append
+    buffer and reach the file in one write when it fills up, or on flush()
+    and close(), instead of one write per save. Pending lines are not
+    visible to other readers of the file until then.
+
+    The cache is reloaded when the file's (mtime_ns, size) no longer match
+    what this instance last read or wrote, so several processes can share
+    one file.
+    """
+    
+    def __init__(self, file_path: str = "leads.txt", write_behind: bool = False):
         self.file_path = file_path
+        self.write_behind = write_behind
+        # File contents are cached after the first access; new leads are
+        # appended to the file and the cache, updates rewrite the file
+        self._leads: List[Lead] = []
+        self._by_email: Dict[str, Lead] = {}
+        self._by_id: Dict[int, Lead] = {}
+        self._next_id = 1
+        self._loaded = False
+        self._cache_key = None
+        # Long-lived append handle, opened on the first insert
+        self._append_fh = None
+        self._pending = False
+        # Set when the file's last line has no newline, so an append does
+        # not run on from it
+        self._needs_newline = False
         self._ensure_file_exists()
     
     def _ensure_file_exists(self):
         """Create the file if it doesn't exist"""
-        if not os.path.exists(self.file_path):
-            with open(self.file_path, 'w') as f:
-                f.write("")  # Create empty file
+        # O_CREAT makes this a single idempotent syscall, no stat needed
+        os.close(os.open(self.file_path, os.O_RDONLY | os.O_CREAT, 0o644))
     
     def _read_leads_from_file(self) -> List[Lead]:
         """Read all leads from the text file"""
         leads = []
+        self._needs_newline = False
         try:
-            with open(self.file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
+            with open(self.file_path, 'rb', buffering=BUFFER_SIZE) as f:
+                for raw_line in f:
+                    self._needs_newline = not raw_line.endswith(b'\n')
+                    line = raw_line.strip()
                     if line:  # Skip empty lines
                         try:
-                            lead_data = json.loads(line)
-                            lead = Lead(
-                                name=lead_data['name'],
-                                email=lead_data['email'],
-                                id=lead_data.get('id')
+                            lead_data = loads(line)
+                            lead = Lead._unchecked(
+                                lead_data['name'],
+                                lead_data['email'],
+                                lead_data.get('id')
                             )
                             leads.append(lead)
-                        except (json.JSONDecodeError, KeyError) as e:
+                        except (
+                            json.JSONDecodeError, UnicodeDecodeError, KeyError
+                        ) as e:
                             logger.warning(
-                                f"Skipping invalid line: {line}. Error: {e}"
+                                "Skipping invalid line: %r. Error: %s", line, e
                             )
         except FileNotFoundError:
             logger.info(
-                f"File {self.file_path} not found, "
-                f"starting with empty repository"
+                "File %s not found, starting with empty repository",
+                self.file_path
             )
         return leads
     
+    def _lead_line(self, lead: Lead) -> bytes:
+        """Encode a lead as one JSON line"""
+        lead_data = {
+            'name': lead.name,
+            'email': lead.email,
+            'id': lead.id
+        }
+        return dumps(lead_data) + b'\n'
+    
     def _write_leads_to_file(self, leads: List[Lead]):
         """Write all leads to the text file"""
-        with open(self.file_path, 'w') as f:
-            for lead in leads:
-                lead_data = {
-                    'name': lead.name,
-                    'email': lead.email,
-                    'id': lead.id
-                }
-                f.write(json.dumps(lead_data) + '\n')
-    
-    def _get_next_id(self, leads: List[Lead]) -> int:
-        """Get the next available ID"""
-        if not leads:
-            return 1
-        max_id = max(lead.id for lead in leads if lead.id is not None)
-        return max_id + 1
+        # Pending appends must land before the rewrite truncates the file,
+        # or they would be written again after it
+        self.flush()
+        with open(self.file_path, 'wb', buffering=BUFFER_SIZE) as f:
+            f.write(b"".join(self._lead_line(lead) for lead in leads))
+            f.flush()
+            self._remember_stat(f)
+        self._needs_newline = False
     
-    def save(self, lead: Lead) -> Lead:
-        """Save a lead and return it with an assigned ID"""
-        leads = self._read_leads_from_file()
-        
-        # Assign ID if not present
-        if lead.id is None:
-            lead.id = self._get_next_id(leads)
-        
-        # Check if lead already exists (update case)
-        existing_index = None
-        for i, existing_lead in enumerate(leads):
-            if existing_lead.id == lead.id:
-                existing_index = i
-                break
+    def _append_leads_to_file(self, leads: List[Lead]):
+        """Append leads as JSON lines with a single write"""
+        if self._append_fh is None:
+            self._append_fh = open(self.file_path, 'ab', buffering=BUFFER_SIZE)
+        data = b"".join(self._lead_line(lead) for lead in leads)
+        if self._needs_newline:
+            data = b'\n' + data
+            self._needs_newline = False
+        self._append_fh.write(data)
+        # Flush so other readers of the file see the leads straight away,
+        # unless writes are being batched
+        self._pending = True
+        if not self.write_behind:
+            self.flush()
+    
+    def flush(self):
+        """Write any buffered appends to the file"""
+        if self._pending:
+            self._append_fh.flush()
+            self._pending = False
+            self._remember_stat(self._append_fh)
+    
+    def close(self):
+        """Flush and close the long-lived append handle"""
+        if self._append_fh is not None:
+            self.flush()
+            self._append_fh.close()
+            self._append_fh = None
+    
+    def _remember_stat(self, f):
+        """Record the file state the cache corresponds to"""
+        st = os.fstat(f.fileno())
+        self._cache_key = (st.st_mtime_ns, st.st_size)
+    
+    def _load(self):
+        """Fill the cache, re-reading it if another writer changed the file"""
+        if self._loaded:
+            # Pending appends would make the file look foreign; it is
+            # checked again once they have been flushed
+            if self._pending:
+                return
+            try:
+                st = os.stat(self.file_path)
+                if (st.st_mtime_ns, st.st_size) == self._cache_key:
+                    return
+            except FileNotFoundError:
+                self._ensure_file_exists()
+            # The file may have been removed or replaced, so the append
+            # handle is reopened on whatever is at the path now
+            self.close()
+            self._leads = []
+            self._by_email = {}
+            self._by_id = {}
         
-        if existing_index is not None:
-            leads[existing_index] = lead
-        else:
-            leads.append(lead)
+        # Stat before reading: a write racing the read changes the key, so
+        # the next call reloads rather than trusting a partial view
+        try:
+            st = os.stat(self.file_path)
+            self._cache_key = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            self._cache_key = None
+        # The next ID is tracked while parsing, so loading is one pass and
+        # saves only bump the counter
+        next_id = 1
+        for lead in self._read_leads_from_file():
+            self._index(lead)
+            self._leads.append(lead)
+            if lead.id is not None and lead.id >= next_id:
+                next_id = lead.id + 1
+        self._next_id = next_id
+        self._loaded = True
+    
+    def _index(self, lead: Lead):
+        """Add a lead to the id and email indexes.
+
+        Lookups return the first lead with a given id or email, as a scan of
+        the file would; leads without an id are only indexed by email.
+        """
+        if lead.id is not None:
+            self._by_id.setdefault(lead.id, lead)
+        self._by_email.setdefault(lead.email, lead)
+    
+    def _reindex_emails(self):
+        """Rebuild the email index after updates changed cached leads"""
+        self._by_email = {}
+        for lead in self._leads:
+            self._by_email.setdefault(lead.email, lead)
+    
+    def _save_all(self, leads: Iterable[Lead]) -> List[Lead]:
+        """Store leads in the cache and write them out in one go"""
+        self._load()
+        saved = []
+        needs_rewrite = False
+        for lead in leads:
+            # Assign ID if not present; explicit IDs push the counter past them
+            if lead.id is None:
+                lead = lead.with_id(self._next_id)
+            self._next_id = max(self._next_id, lead.id + 1)
+            
+            # Updates rewrite the whole file; new leads are appended
+            existing = self._by_id.get(lead.id)
+            if existing is not None:
+                position = next(
+                    i for i, cached in enumerate(self._leads) if cached is existing
+                )
+                self._leads[position] = lead
+                self._by_id[lead.id] = lead
+                needs_rewrite = True
+            else:
+                self._index(lead)
+                self._leads.append(lead)
+            saved.append(lead)
         
-        self._write_leads_to_file(leads)
-        log_msg = (
-            f"Saved lead to file: {lead.name} ({lead.email}) "
-            f"with ID {lead.id}"
+        if needs_rewrite:
+            self._reindex_emails()
+            self._write_leads_to_file(self._leads)
+        elif saved:
+            self._append_leads_to_file(saved)
+        return saved
+    
+    def save(self, lead: Lead) -> Lead:
+        """Save a lead and return it with an assigned ID"""
+        lead = self._save_all([lead])[0]
+        logger.info(
+            "Saved lead to file: %s (%s) with ID %s",
+            lead.name, lead.email, lead.id
         )
-        logger.info(log_msg)
         return lead
     
+    def save_many(self, leads: Iterable[Lead]) -> List[Lead]:
+        """Save several leads with a single append"""
+        saved = self._save_all(leads)
+        logger.info("Saved %d leads to file", len(saved))
+        return saved
+    
     def find_by_email(self, email: str) -> Optional[Lead]:
         """Find a lead by email address"""
-        leads = self._read_leads_from_file()
-        for lead in leads:
-            if lead.email == email:
-                return lead
-        return None
+        self._load()
+        return self._by_email.get(email)
     
     def find_all(self) -> List[Lead]:
         """Return all leads"""
-        return self._read_leads_from_file()
+        self._load()
+        return list(self._leads)
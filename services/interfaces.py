@@ -1,7 +1,7 @@
 # services/interfaces.py
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence
 
 from domain.models import Lead
 
@@ -19,10 +19,40 @@ class LeadRepository(ABC):
     def save(self, lead: Lead) -> Lead:
         pass
     
+    def save_many(self, leads: Iterable[Lead]) -> List[Lead]:
+        """Save several leads and return them with assigned IDs.
+
+        File-backed repositories override this to write the batch at once.
+        """
+        return [self.save(lead) for lead in leads]
+    
+    def save_if_new(self, lead: Lead) -> Optional[Lead]:
+        """Save ``lead`` unless one with the same email exists.
+
+        Returns the saved lead, or None for a duplicate. Repositories with
+        an email index override this to do a single lookup.
+        """
+        if self.find_by_email(lead.email) is not None:
+            return None
+        return self.save(lead)
+    
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[Lead]:
         pass
     
     @abstractmethod
-    def find_all(self) -> List[Lead]:
+    def find_all(self) -> Sequence[Lead]:
         pass
+    
+    def close(self) -> None:
+        """Release any resources held by the repository.
+
+        A no-op by default; file-backed repositories flush and close their
+        long-lived handles.
+        """
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
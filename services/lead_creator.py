@@ -1,4 +1,7 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, List, Tuple
 
 from domain.models import Lead
 
@@ -6,36 +9,84 @@ from .interfaces import LeadRepository
 
 logger = logging.getLogger(__name__)
 
+# Shared by all creators so that building a LeadCreator (e.g. per request)
+# does not spin up threads of its own
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="notify")
+
 
 class LeadCreator:
     def __init__(self, repo: LeadRepository, notifiers):
         self.repo = repo
-        # Handle both single notifier and list of notifiers
-        if isinstance(notifiers, list):
-            self.notifiers = notifiers
+        # Handle both single notifier and list of notifiers; frozen here so
+        # the send methods can be bound once
+        if isinstance(notifiers, (list, tuple)):
+            self.notifiers = tuple(notifiers)
         else:
-            self.notifiers = [notifiers]
+            self.notifiers = (notifiers,)
+        self._notify_fns = tuple(notifier.send for notifier in self.notifiers)
+        # Duck-typed repositories without save_if_new get the generic
+        # find-then-save behaviour from the interface
+        self._save_if_new = getattr(repo, "save_if_new", None) or partial(
+            LeadRepository.save_if_new, repo
+        )
+        self._save_many = getattr(repo, "save_many", None) or partial(
+            LeadRepository.save_many, repo
+        )
 
     def create_lead(self, name: str, email: str) -> Lead:
-        # Check for duplicate email
-        existing_lead = self.repo.find_by_email(email)
-        if existing_lead:
-            raise ValueError(f"Lead with email {email} already exists")
-        
         # Create lead without ID - let repository handle ID generation
         lead = Lead(name=name, email=email)
         
-        # Repository assigns ID and returns the saved lead
-        saved_lead = self.repo.save(lead)
+        # Repository checks for a duplicate email, assigns the ID and
+        # returns the saved lead in one call
+        saved_lead = self._save_if_new(lead)
+        if saved_lead is None:
+            raise ValueError(f"Lead with email {email} already exists")
         
         # Notify after successful save
-        for notifier in self.notifiers:
-            message = f"New lead created: {saved_lead.name}"
-            notifier.send(message, saved_lead.email)
+        self._notify(saved_lead)
         
-        log_msg = (
-            f"Lead created successfully: {saved_lead.name} "
-            f"with ID {saved_lead.id}"
+        logger.info(
+            "Lead created successfully: %s with ID %s",
+            saved_lead.name, saved_lead.id
         )
-        logger.info(log_msg)
         return saved_lead
+
+    def create_many(self, pairs: Iterable[Tuple[str, str]]) -> List[Lead]:
+        """Create leads from (name, email) pairs in one repository call.
+
+        Every pair is validated before anything is saved. Emails that are
+        already stored, or repeated within the batch, are skipped.
+        """
+        leads = [Lead(name=name, email=email) for name, email in pairs]
+        
+        seen = set()
+        new_leads = []
+        for lead in leads:
+            if lead.email in seen or self.repo.find_by_email(lead.email):
+                continue
+            seen.add(lead.email)
+            new_leads.append(lead)
+        
+        saved_leads = self._save_many(new_leads)
+        for saved_lead in saved_leads:
+            self._notify(saved_lead)
+        
+        logger.info("Created %d leads", len(saved_leads))
+        return saved_leads
+
+    def _notify(self, lead: Lead) -> None:
+        # Every notifier gets the same message, so build it once
+        message = f"New lead created: {lead.name}"
+        recipient = lead.email
+        if len(self._notify_fns) <= 1:
+            for send in self._notify_fns:
+                send(message, recipient)
+            return
+        
+        # Notifiers are I/O bound, so they run concurrently: a create takes
+        # as long as the slowest notifier rather than the sum of all of them.
+        # list() re-raises notifier errors
+        list(_NOTIFY_POOL.map(
+            lambda send: send(message, recipient), self._notify_fns
+        ))
@@ -4,6 +4,10 @@ from setuptools import find_packages, setup
 setup(
     name='lead_manager',
     version='0.1',
+    python_requires='>=3.10',
     packages=find_packages(),
     install_requires=[],
+    extras_require={
+        'fast': ['orjson'],
+    },
 )
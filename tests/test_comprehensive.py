@@ -20,26 +20,42 @@ from infrastructure.txt_lead_repo import TxtFileLeadRepository
 from services.lead_creator import LeadCreator
 
 
+def _empty_file(path):
+    """Truncate (or create) a repository file and return its path."""
+    open(path, 'wb').close()
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def repository_dir(tmp_path_factory):
+    """One directory per module; pytest removes it, no per-test unlink."""
+    return tmp_path_factory.mktemp("repositories")
+
+
 class TestRepositoryImplementations:
     """Test all repository implementations for interface compliance."""
 
     @pytest.fixture(params=[
-        InMemoryLeadRepository,
-        lambda: TxtFileLeadRepository(tempfile.mktemp(suffix='.txt')),
-        lambda: JsonLeadRepository(tempfile.mktemp(suffix='.json'))
-    ])
-    def repository(self, request):
-        """Parameterized fixture that tests all repository types."""
-        if callable(request.param):
-            repo = request.param()
-        else:
-            repo = request.param()
+        lambda directory: InMemoryLeadRepository(),
+        lambda directory: TxtFileLeadRepository(
+            _empty_file(directory / 'leads.txt')
+        ),
+        lambda directory: JsonLeadRepository(
+            _empty_file(directory / 'leads.json')
+        )
+    ], ids=["in_memory", "txt", "json"])
+    def repository(self, request, repository_dir):
+        """Parameterized fixture that tests all repository types.
+
+        File-backed repositories reuse one file per type, truncated before
+        each test.
+        """
+        repo = request.param(repository_dir)
         
         yield repo
         
-        # Cleanup file-based repositories
-        if hasattr(repo, 'file_path') and os.path.exists(repo.file_path):
-            os.unlink(repo.file_path)
+        if hasattr(repo, 'close'):
+            repo.close()
 
     def test_save_assigns_id_to_new_lead(self, repository):
         """Test that save() assigns an ID to leads without one."""
@@ -61,6 +77,14 @@ class TestRepositoryImplementations:
         
         assert saved_lead.id == 42
 
+    def test_save_explicit_id_moves_next_id_past_it(self, repository):
+        """Test that auto-assigned IDs never reuse an explicit one."""
+        repository.save(Lead(name="Explicit", email="explicit@example.com", id=2))
+        
+        assert repository.save(Lead(name="New", email="new@example.com")).id == 3
+        assert repository.find_by_email("explicit@example.com").id == 2
+        assert len(repository.find_all()) == 2
+
     def test_find_by_email_returns_correct_lead(self, repository):
         """Test that find_by_email() returns the correct lead."""
         lead1 = Lead(name="User 1", email="user1@example.com")
@@ -99,6 +123,29 @@ class TestRepositoryImplementations:
         assert "user2@example.com" in emails
         assert "user3@example.com" in emails
 
+    def test_save_many_assigns_sequential_ids(self, repository):
+        """Test that save_many() saves a whole batch with sequential IDs."""
+        saved = repository.save_many([
+            Lead(name="User 1", email="user1@example.com"),
+            Lead(name="User 2", email="user2@example.com"),
+            Lead(name="User 3", email="user3@example.com")
+        ])
+        
+        assert [lead.id for lead in saved] == [1, 2, 3]
+        assert len(repository.find_all()) == 3
+        assert repository.find_by_email("user2@example.com").id == 2
+
+    def test_save_if_new_skips_duplicate_email(self, repository):
+        """Test that save_if_new() only saves leads with unseen emails."""
+        saved = repository.save_if_new(Lead(name="User 1", email="dup@example.com"))
+        assert saved is not None
+        
+        duplicate = repository.save_if_new(Lead(name="User 2", email="dup@example.com"))
+        
+        assert duplicate is None
+        assert len(repository.find_all()) == 1
+        assert repository.find_by_email("dup@example.com").name == "User 1"
+
     def test_sequential_ids(self, repository):
         """Test that IDs are assigned sequentially."""
         lead1 = repository.save(Lead(name="User 1", email="user1@example.com"))
@@ -106,6 +153,15 @@ class TestRepositoryImplementations:
         
         assert lead2.id == lead1.id + 1
 
+    def test_context_manager_closes_repository(self, repository):
+        """Test that a repository can be used in a with block."""
+        with repository as repo:
+            assert repo is repository
+            repo.save(Lead(name="Test User", email="test@example.com"))
+        
+        # close() is safe to call again on a closed repository
+        repository.close()
+
 
 class TestNotifierImplementations:
     """Test all notifier implementations for interface compliance."""
@@ -182,6 +238,7 @@ class TestIntegrationScenarios:
             assert found.name == "Test User"
             
             # Cleanup
+            repo.close()
             if hasattr(repo, 'file_path') and os.path.exists(repo.file_path):
                 os.unlink(repo.file_path)
 
@@ -225,6 +282,7 @@ class TestIntegrationScenarios:
                 creator.create_lead("Another User", "duplicate@test.com")
             
             # Cleanup
+            repo.close()
             if hasattr(repo, 'file_path') and os.path.exists(repo.file_path):
                 os.unlink(repo.file_path)
 
@@ -235,32 +293,301 @@ class TestFileFormats:
     def test_txt_repository_format(self):
         """Test that TxtFileLeadRepository uses JSON lines format."""
         temp_file = tempfile.mktemp(suffix='.txt')
-        repo = TxtFileLeadRepository(temp_file)
+        with TxtFileLeadRepository(temp_file) as repo:
+            repo.save(Lead(name="Test User", email="test@example.com"))
+            
+            with open(temp_file, 'r') as f:
+                line = f.readline().strip()
+                data = json.loads(line)
+                assert data['name'] == "Test User"
+                assert data['email'] == "test@example.com"
+                assert 'id' in data
+        
+        os.unlink(temp_file)
+
+    def test_txt_repository_appends_and_reloads(self):
+        """Test that appended leads and updates survive a reload."""
+        temp_file = tempfile.mktemp(suffix='.txt')
+        with TxtFileLeadRepository(temp_file) as repo:
+            repo.save(Lead(name="User 1", email="user1@example.com"))
+            repo.save(Lead(name="User 2", email="user2@example.com"))
+            repo.save(Lead(name="Renamed", email="user1@example.com", id=1))
+            repo.save(Lead(name="User 3", email="user3@example.com"))
+            
+            with open(temp_file, 'r') as f:
+                ids = [json.loads(line)['id'] for line in f]
+                assert ids == [1, 2, 3]
+        
+        with TxtFileLeadRepository(temp_file) as reloaded:
+            assert reloaded.find_by_email("user1@example.com").name == "Renamed"
+            assert reloaded.save(Lead(name="User 4", email="u4@example.com")).id == 4
+        
+        os.unlink(temp_file)
+
+    def test_txt_repository_finds_leads_without_ids(self):
+        """Test that lines without an id are all found by email."""
+        temp_file = tempfile.mktemp(suffix='.txt')
+        with open(temp_file, 'w') as f:
+            f.write(json.dumps({"name": "A", "email": "a@x.com"}) + "\n")
+            f.write(json.dumps({"name": "B", "email": "b@x.com"}) + "\n")
+        
+        with TxtFileLeadRepository(temp_file) as repo:
+            assert repo.find_by_email("a@x.com").name == "A"
+            assert repo.find_by_email("b@x.com").name == "B"
+            assert repo.save_if_new(Lead(name="Again", email="a@x.com")) is None
+        
+        os.unlink(temp_file)
+
+    def test_txt_repository_appends_after_missing_final_newline(self):
+        """Test that an append does not join the last line of the file."""
+        temp_file = tempfile.mktemp(suffix='.txt')
+        with open(temp_file, 'w') as f:
+            f.write(json.dumps({"name": "A", "email": "a@x.com", "id": 1}))
         
-        repo.save(Lead(name="Test User", email="test@example.com"))
+        with TxtFileLeadRepository(temp_file) as repo:
+            repo.save(Lead(name="B", email="b@x.com"))
+        
+        with TxtFileLeadRepository(temp_file) as reloaded:
+            assert [lead.name for lead in reloaded.find_all()] == ["A", "B"]
+        
+        os.unlink(temp_file)
+
+    def test_txt_repository_write_behind(self):
+        """Test that write-behind appends reach the file on flush()."""
+        temp_file = tempfile.mktemp(suffix='.txt')
+        with TxtFileLeadRepository(temp_file, write_behind=True) as repo:
+            repo.save(Lead(name="User 1", email="user1@example.com"))
+            repo.save(Lead(name="User 2", email="user2@example.com"))
+            assert repo.find_by_email("user2@example.com").id == 2
+            assert os.path.getsize(temp_file) == 0
+            
+            repo.flush()
+            with open(temp_file, 'r') as f:
+                assert [json.loads(line)['id'] for line in f] == [1, 2]
+        
+        os.unlink(temp_file)
+
+    def test_txt_repository_sees_other_writers(self):
+        """Test that a cached txt repository reloads after another writer."""
+        temp_file = tempfile.mktemp(suffix='.txt')
+        with (
+            TxtFileLeadRepository(temp_file) as first,
+            TxtFileLeadRepository(temp_file) as second
+        ):
+            assert second.find_all() == []
+            
+            first.save(Lead(name="User 1", email="user1@example.com"))
+            assert second.find_by_email("user1@example.com") is not None
+            
+            lead = second.save(Lead(name="User 2", email="user2@example.com"))
+            assert lead.id == 2
+            assert len(first.find_all()) == 2
+        
+        os.unlink(temp_file)
+
+    def test_txt_repository_appends_after_file_is_replaced(self):
+        """Test that saves land in a file another writer swapped in."""
+        temp_file = tempfile.mktemp(suffix='.txt')
+        with TxtFileLeadRepository(temp_file) as repo:
+            repo.save(Lead(name="A", email="a@x.com"))
+            
+            replacement = temp_file + '.new'
+            with open(replacement, 'w') as f:
+                f.write(json.dumps({"name": "C", "email": "c@x.com", "id": 9}) + "\n")
+            os.replace(replacement, temp_file)
+            
+            assert repo.save(Lead(name="B", email="b@x.com")).id == 10
+            assert [lead.name for lead in repo.find_all()] == ["C", "B"]
         
         with open(temp_file, 'r') as f:
-            line = f.readline().strip()
-            data = json.loads(line)
-            assert data['name'] == "Test User"
-            assert data['email'] == "test@example.com"
-            assert 'id' in data
+            assert [json.loads(line)['name'] for line in f] == ["C", "B"]
         
         os.unlink(temp_file)
 
     def test_json_repository_format(self):
         """Test that JsonLeadRepository uses structured JSON format."""
         temp_file = tempfile.mktemp(suffix='.json')
-        repo = JsonLeadRepository(temp_file)
+        with JsonLeadRepository(temp_file) as repo:
+            repo.save(Lead(name="Test User", email="test@example.com"))
+            
+            with open(temp_file, 'r') as f:
+                data = json.load(f)
+                assert 'leads' in data
+                assert 'next_id' in data
+                assert len(data['leads']) == 1
+                assert data['leads'][0]['name'] == "Test User"
         
-        repo.save(Lead(name="Test User", email="test@example.com"))
+        os.unlink(temp_file)
+
+    def test_json_repository_appends_and_reloads(self):
+        """Test that appended leads and updates survive a reload."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with JsonLeadRepository(temp_file) as repo:
+            repo.save(Lead(name="User 1", email="user1@example.com"))
+            repo.save(Lead(name="User 2", email="user2@example.com"))
+            repo.save(Lead(name="Renamed", email="user1@example.com", id=1))
+            repo.save(Lead(name="User 3", email="user3@example.com"))
+            
+            with open(temp_file, 'r') as f:
+                data = json.load(f)
+                assert [lead['id'] for lead in data['leads']] == [1, 2, 3]
+                assert data['next_id'] == 4
         
-        with open(temp_file, 'r') as f:
-            data = json.load(f)
-            assert 'leads' in data
-            assert 'next_id' in data
-            assert len(data['leads']) == 1
-            assert data['leads'][0]['name'] == "Test User"
+        with JsonLeadRepository(temp_file) as reloaded:
+            assert reloaded.find_by_email("user1@example.com").name == "Renamed"
+            assert reloaded.save(Lead(name="User 4", email="u4@example.com")).id == 4
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_find_all_tracks_saves(self):
+        """Test that leads cached by find_all follow later appends and updates."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with JsonLeadRepository(temp_file) as repo:
+            repo.save(Lead(name="User 1", email="user1@example.com"))
+            assert [lead.name for lead in repo.find_all()] == ["User 1"]
+            
+            repo.save(Lead(name="User 2", email="user2@example.com"))
+            repo.save(Lead(name="Renamed", email="user1@example.com", id=1))
+            assert [lead.name for lead in repo.find_all()] == ["Renamed", "User 2"]
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_reads_leads_keyed_by_id(self):
+        """Test that a 'leads' object keyed by id is loaded as well."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with open(temp_file, 'w') as f:
+            json.dump({
+                "leads": {"7": {"name": "Keyed", "email": "keyed@example.com"}},
+                "next_id": 8
+            }, f)
+        
+        with JsonLeadRepository(temp_file) as repo:
+            assert repo.find_by_email("keyed@example.com").id == 7
+            assert repo.save(Lead(name="New", email="new@example.com")).id == 8
+            
+            with open(temp_file, 'r') as f:
+                assert [lead['id'] for lead in json.load(f)['leads']] == [7, 8]
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_skips_invalid_keys(self):
+        """Test that non-numeric keys in an id-keyed file are skipped."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with open(temp_file, 'w') as f:
+            json.dump({
+                "leads": {
+                    "abc": {"name": "Bad", "email": "bad@example.com"},
+                    "2": {"name": "Good", "email": "good@example.com"}
+                },
+                "next_id": 3
+            }, f)
+        
+        with JsonLeadRepository(temp_file) as repo:
+            assert [lead.name for lead in repo.find_all()] == ["Good"]
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_tolerates_invalid_utf8(self):
+        """Test that a file that is not valid UTF-8 loads as empty."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with open(temp_file, 'wb') as f:
+            f.write(b'{"leads": [{"name": "\xff", "email": "a@x.com"}]}')
+        
+        # The stdlib fallback reports bad bytes as UnicodeDecodeError
+        with patch('infrastructure.json_codec.orjson', None), \
+                patch('infrastructure.json_lead_repo.HAS_ORJSON', False):
+            with JsonLeadRepository(temp_file) as repo:
+                assert repo.find_all() == []
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_next_id_skips_stored_ids(self):
+        """Test that a stale next_id in the file never reuses a stored id."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with open(temp_file, 'w') as f:
+            json.dump({
+                "leads": [{"id": 5, "name": "Old", "email": "old@example.com"}]
+            }, f)
+        
+        with JsonLeadRepository(temp_file) as repo:
+            assert repo.save(Lead(name="New", email="new@example.com")).id == 6
+            assert repo.find_by_email("old@example.com").name == "Old"
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_sees_other_writers(self):
+        """Test that a repository reloads when another writer changes the file."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with (
+            JsonLeadRepository(temp_file) as first,
+            JsonLeadRepository(temp_file) as second
+        ):
+            first.save(Lead(name="User 1", email="user1@example.com"))
+            assert second.find_by_email("user1@example.com") is not None
+            
+            lead = second.save(Lead(name="User 2", email="user2@example.com"))
+            assert lead.id == 2
+            assert len(first.find_all()) == 2
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_write_behind(self):
+        """Test that write-behind appends reach the file on flush()."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with JsonLeadRepository(temp_file, write_behind=True) as repo:
+            repo.save(Lead(name="User 1", email="user1@example.com"))
+            repo.save(Lead(name="User 2", email="user2@example.com"))
+            assert repo.find_by_email("user2@example.com").id == 2
+            with open(temp_file, 'r') as f:
+                assert json.load(f)['leads'] == []
+            
+            repo.flush()
+            with open(temp_file, 'r') as f:
+                data = json.load(f)
+                assert [lead['id'] for lead in data['leads']] == [1, 2]
+                assert data['next_id'] == 3
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_rewrite_keeps_rows_without_unique_ids(self):
+        """Test that rows without an id, or sharing one, survive a rewrite."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        rows = [
+            {"name": "A", "email": "a@x.com"},
+            {"name": "B", "email": "b@x.com"},
+            {"id": 3, "name": "C", "email": "c@x.com"},
+            {"id": 3, "name": "D", "email": "d@x.com"}
+        ]
+        with open(temp_file, 'w') as f:
+            json.dump({"leads": rows, "next_id": 4}, f)
+        
+        with JsonLeadRepository(temp_file) as repo:
+            assert repo.find_by_email("a@x.com").name == "A"
+            assert repo.find_by_email("d@x.com").id == 3
+            repo.save(Lead(name="New", email="new@x.com"))
+            
+            with open(temp_file, 'r') as f:
+                data = json.load(f)
+                assert data['leads'][:4] == rows
+                assert data['leads'][4]['email'] == "new@x.com"
+        
+        os.unlink(temp_file)
+
+    def test_json_repository_reads_indented_files(self):
+        """Test that indented JSON files are loaded and normalized on save."""
+        temp_file = tempfile.mktemp(suffix='.json')
+        with open(temp_file, 'w') as f:
+            json.dump({
+                "leads": [{"id": 1, "name": "Old", "email": "old@example.com"}],
+                "next_id": 2
+            }, f, indent=2)
+        
+        with JsonLeadRepository(temp_file) as repo:
+            repo.save(Lead(name="New", email="new@example.com"))
+            
+            with open(temp_file, 'r') as f:
+                data = json.load(f)
+                assert [lead['name'] for lead in data['leads']] == ["Old", "New"]
         
         os.unlink(temp_file)
 
@@ -1,4 +1,7 @@
 # services/tests/test_lead_creator.py
+import threading
+from dataclasses import replace
+
 import pytest
 
 from domain.models import Lead
@@ -12,7 +15,7 @@ class FakeRepo:
     def save(self, lead):
         # Assign ID if not present (like real repository would)
         if lead.id is None:
-            lead.id = len(self.saved) + 1
+            lead = replace(lead, id=len(self.saved) + 1)
         self.saved.append(lead)
         return lead  # Return the saved lead as per interface contract
     
@@ -59,3 +62,75 @@ def test_create_lead_invalid_email():
 
     assert repo.saved == []
     assert notifier.messages == []
+
+
+@pytest.mark.parametrize("email", [
+    "alin@", "@example.com", "alin@ex@ample.com", "alin @example.com",
+    "alin@example.com\n"
+])
+def test_create_lead_rejects_malformed_email(email):
+    service = LeadCreator(FakeRepo(), FakeNotifier())
+
+    with pytest.raises(ValueError, match="Invalid email format"):
+        service.create_lead("Alin", email)
+
+
+def test_create_lead_asks_repository_for_duplicates():
+    repo = FakeRepo()
+    service = LeadCreator(repo, FakeNotifier())
+    service.create_lead("Alin", "alin@example.com")
+
+    with pytest.raises(ValueError, match="already exists"):
+        service.create_lead("Alin Again", "alin@example.com")
+
+    repo.saved.clear()  # the email is free again, e.g. after a delete
+    service.create_lead("Alin Again", "alin@example.com")
+
+    assert [lead.name for lead in repo.saved] == ["Alin Again"]
+
+
+def test_create_many_skips_duplicates():
+    repo = FakeRepo()
+    notifier = FakeNotifier()
+    service = LeadCreator(repo, notifier)
+    service.create_lead("Alin", "alin@example.com")
+
+    created = service.create_many([
+        ("Alin Again", "alin@example.com"),
+        ("Bob", "bob@example.com"),
+        ("Bob Again", "bob@example.com"),
+    ])
+
+    assert [lead.name for lead in created] == ["Bob"]
+    assert len(repo.saved) == 2
+    assert [recipient for _, recipient in notifier.messages] == [
+        "alin@example.com", "bob@example.com"
+    ]
+
+
+def test_create_many_validates_before_saving():
+    repo = FakeRepo()
+    service = LeadCreator(repo, FakeNotifier())
+
+    with pytest.raises(ValueError):
+        service.create_many([("Alin", "alin@example.com"), ("Bob", "no-at")])
+
+    assert repo.saved == []
+
+
+def test_create_lead_runs_notifiers_concurrently():
+    # Each notifier waits for the other, which only succeeds if they overlap
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierNotifier(FakeNotifier):
+        def send(self, message, recipient):
+            barrier.wait()
+            super().send(message, recipient)
+
+    repo = FakeRepo()
+    notifiers = [BarrierNotifier(), BarrierNotifier()]
+    service = LeadCreator(repo, notifiers)
+
+    service.create_lead("Alin", "alin@example.com")
+
+    assert all(len(n.messages) == 1 for n in notifiers)
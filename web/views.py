@@ -2,21 +2,34 @@
 
 import logging
 
+from django.http import HttpResponse, HttpResponseBadRequest
+
 from infrastructure.db_lead_repo import DjangoLeadRepository
 from infrastructure.email_notifier import EmailNotifier
 from services.lead_creator import LeadCreator
 
 logger = logging.getLogger(__name__)
 
+# Built once per worker process and shared across requests: the repository
+# and notifiers hold no per-lead state, and the creator only keeps
+# references to them, so every duplicate check still goes to the repository
+_REPO = DjangoLeadRepository()
+_NOTIFIERS = (EmailNotifier(),)
+_CREATOR = LeadCreator(repo=_REPO, notifiers=_NOTIFIERS)
+
 
 def create_lead_view(request):
-    name = request.POST["name"]
-    email = request.POST["email"]
-
-    creator = LeadCreator(
-        repo=DjangoLeadRepository(),
-        notifier=EmailNotifier()
-    )
-    creator.create_lead(name, email)
+    post = request.POST
+    name = (post.get("name") or "").strip()
+    email = (post.get("email") or "").strip()
+
+    # Reject obviously malformed input before touching the repository
+    if not name or len(name) > 100 or "@" not in email:
+        return HttpResponseBadRequest("A name and a valid email are required")
+
+    try:
+        _CREATOR.create_lead(name, email)
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
     logger.info("Lead saved")
-    return True
+    return HttpResponse("Lead created", status=201)